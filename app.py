@@ -126,6 +126,38 @@ class Booking(db.Model):
             'status': self.status
         }
 
+# Read-only Booking Row
+class BookingRow:
+    """Lightweight read-only booking row for admin listings and exports"""
+
+    __slots__ = ('id', 'book_number', 'name', 'phone', 'message', 'status', '_created_at')
+
+    def __init__(self, id, book_number, name, phone, message, created_at, status):
+        self.id = id
+        self.book_number = book_number
+        self.name = name
+        self.phone = phone
+        self.message = message
+        self.status = status
+        self._created_at = created_at
+
+    @property
+    def created_at(self):
+        """Booking timestamp, formatted only when it is actually read"""
+        if self._created_at is None:
+            return ''
+        return self._created_at.strftime('%Y-%m-%d %H:%M:%S')
+
+BOOKING_ROW_COLUMNS = (
+    Booking.id,
+    Booking.book_number,
+    Booking.name,
+    Booking.phone,
+    Booking.message,
+    Booking.created_at,
+    Booking.status,
+)
+
 # Utility Functions
 def generate_book_number():
     """Generate unique booking number"""
@@ -133,6 +165,11 @@ def generate_book_number():
     random_suffix = ''.join(random.choices(string.digits, k=6))
     return f"{prefix}-{random_suffix}"
 
+def get_booking_rows():
+    """Fetch all bookings, newest first, as read-only rows without ORM instances"""
+    query = db.session.query(*BOOKING_ROW_COLUMNS).order_by(Booking.created_at.desc())
+    return [BookingRow(*row) for row in query]
+
 def check_database_schema():
     """Check database schema and table structure"""
     conn = sqlite3.connect('instance/bookings.db')
@@ -180,12 +217,14 @@ def check_duplicates():
     """)
     duplicate_customers = cursor.fetchall()
     
-    # Get all bookings for reference
-    cursor.execute("SELECT id, book_number, name, phone, created_at FROM booking ORDER BY created_at DESC")
-    all_bookings = cursor.fetchall()
-    
     conn.close()
     
+    # Get all bookings for reference
+    all_bookings = [
+        (b.id, b.book_number, b.name, b.phone, b.created_at)
+        for b in get_booking_rows()
+    ]
+    
     return {
         'duplicate_book_numbers': duplicate_book_numbers,
         'duplicate_customers': duplicate_customers,
@@ -328,8 +367,7 @@ def all_customers():
     if not session.get('admin_logged_in'):
         return redirect(url_for('admin_login'))
     
-    bookings = Booking.query.order_by(Booking.created_at.desc()).all()
-    return render_template('all_customers.html', bookings=[b.to_dict() for b in bookings])
+    return render_template('all_customers.html', bookings=get_booking_rows())
 
 @app.route('/admin/booking/<int:booking_id>/status', methods=['PUT'])
 def update_booking_status(booking_id):
@@ -354,7 +392,7 @@ def export_customers_excel():
         from datetime import datetime
         
         # Get all bookings
-        bookings = Booking.query.order_by(Booking.created_at.desc()).all()
+        bookings = get_booking_rows()
         
         # Create workbook and worksheet
         wb = Workbook()
@@ -384,7 +422,7 @@ def export_customers_excel():
             ws.cell(row=row, column=2, value=booking.name)
             ws.cell(row=row, column=3, value=booking.phone)
             ws.cell(row=row, column=4, value=booking.message or "")
-            ws.cell(row=row, column=5, value=booking.created_at.strftime('%Y-%m-%d %H:%M:%S'))
+            ws.cell(row=row, column=5, value=booking.created_at)
             ws.cell(row=row, column=6, value=booking.status.title())
         
         # Auto-adjust column widths with better handling